@@ -0,0 +1,175 @@
+"""
+Focus Point Caching
+===================
+
+This module caches computed focus points so repeated requests skip decoding and saliency:
+- By URL, revalidated with `ETag`/`Last-Modified` conditional requests when the origin
+  provides validators (a 304 reply reuses the cached result without downloading)
+- By a perceptual hash (pHash) of the decoded image, so the same picture served under
+  different URLs, or at different resolutions, is only analyzed once
+
+pHash squashes every image to a 32x32 square, and nearly blank images (small products
+on white, say) all hash alike, so a content-level hit is only used if the image's
+aspect ratio and grayscale thumbnail also match the cached one. Degenerate hashes
+(all bits equal) are never cached. Entries store the focus point relative to the image
+size, so a hit is rescaled to the dimensions of the image being requested.
+
+Dependencies:
+- OpenCV (`cv2.img_hash`, from opencv-contrib)
+- NumPy
+"""
+
+import cv2
+import numpy as np
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from .saliency import download_image, decode_image, thumbnail, thumbnails_match
+
+# Maximum number of cached URLs / distinct image hashes
+URL_CACHE_SIZE = 1024
+CONTENT_CACHE_SIZE = 4096
+
+# pHash digests carrying no information about the image (all bits equal)
+_DEGENERATE_HASHES = frozenset((bytes(8), b"\xff" * 8))
+
+FocusResult = Tuple[Tuple[int, int], Tuple[int, int]]
+ComputeFn = Callable[[np.ndarray, Optional[Tuple[int, int]]], FocusResult]
+
+
+class LRUCache:
+    """
+    Minimal thread-safe least-recently-used cache.
+
+    Args:
+        maxsize (int): Maximum number of entries kept before evicting the oldest.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for `key` (marking it recently used), or None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Store `value` under `key`, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class UrlEntry(NamedTuple):
+    """Cached focus result for a URL, with the HTTP validators it was served with."""
+
+    result: FocusResult
+    validators: Dict[str, str]
+
+
+class ContentEntry(NamedTuple):
+    """Cached focus point for an image hash, with what is needed to confirm a hit."""
+
+    rel: Tuple[float, float]
+    aspect: float
+    thumb: np.ndarray
+
+
+url_cache = LRUCache(URL_CACHE_SIZE)
+content_cache = LRUCache(CONTENT_CACHE_SIZE)
+
+
+def image_hash(img: np.ndarray) -> bytes:
+    """
+    Compute the 64-bit perceptual hash of an image.
+
+    Args:
+        img (np.ndarray): Image in BGR format.
+
+    Returns:
+        bytes: 8-byte pHash digest.
+    """
+    return cv2.img_hash.pHash(img).tobytes()
+
+
+def focus_from_image(img: np.ndarray, size: Optional[Tuple[int, int]], compute: ComputeFn) -> FocusResult:
+    """
+    Return the focus point of a decoded image, reusing results for perceptually identical images.
+
+    Args:
+        img (np.ndarray): Image in BGR format (possibly decoded at reduced resolution).
+        size (Tuple[int, int], optional): (width, height) of the original image.
+        compute (Callable): Function computing the focus point, with the signature of
+            `find_salient_point`.
+
+    Returns:
+        Tuple[Tuple[int, int], Tuple[int, int]]: (cx, cy), (width, height) in original coordinates.
+    """
+    w, h = size if size is not None else (img.shape[1], img.shape[0])
+    key = image_hash(img)
+    if key in _DEGENERATE_HASHES:
+        return compute(img, size)
+
+    aspect, thumb = w / h, thumbnail(img)
+    entry = content_cache.get(key)
+    if entry is not None and thumbnails_match(thumb, aspect, entry.thumb, entry.aspect):
+        cx, cy = int(entry.rel[0] * w), int(entry.rel[1] * h)
+        logging.info(f"Content cache hit: focus ({cx}, {cy})")
+        return (cx, cy), (w, h)
+
+    (cx, cy), (w, h) = result = compute(img, size)
+    content_cache.put(key, ContentEntry(((cx + 0.5) / w, (cy + 0.5) / h), aspect, thumb))
+    return result
+
+
+def focus_from_url(url: str, compute: ComputeFn, reduce: Optional[int] = 1) -> FocusResult:
+    """
+    Return the focus point of the image at `url`, using the URL and content caches.
+
+    A URL cached without validators is served straight from the cache; one with
+    validators is revalidated with a conditional request first.
+
+    Args:
+        url (str): Direct link to an image file.
+        compute (Callable): Function computing the focus point, with the signature of
+            `find_salient_point`.
+        reduce (int, optional): Decode at 1/`reduce` resolution (1, 2, 4 or 8), or None to
+            pick the largest factor that keeps the longest side at least `SALIENCY_MAX_DIM`.
+            Defaults to 1.
+
+    Returns:
+        Tuple[Tuple[int, int], Tuple[int, int]]: (cx, cy), (width, height) of the image.
+
+    Raises:
+        requests.RequestException: If the image could not be downloaded.
+        ValueError: If the image could not be decoded.
+    """
+    entry = url_cache.get(url)
+    if entry is not None and not entry.validators:
+        logging.info(f"URL cache hit: {url}")
+        return entry.result
+
+    logging.info(f"Loading image from URL: {url}")
+    arr, validators = download_image(url, entry.validators if entry is not None else None)
+    if arr is None:
+        logging.info(f"URL cache hit (not modified): {url}")
+        return entry.result
+
+    img, size = decode_image(arr, reduce, source=f"URL: {url}")
+    result = focus_from_image(img, size, compute)
+    url_cache.put(url, UrlEntry(result, validators))
+    return result
@@ -10,6 +10,7 @@ Endpoints:
 ---------
 - GET /focus?url=...         → Process image from URL
 - GET /focus?path=...        → Process image from local path
+- POST /focus_batch          → Process a list of image URLs concurrently
 
 Returns:
 --------
@@ -20,14 +21,22 @@ Author: [Your Name]
 Date: 2025-05-19
 """
 
-from flask import Flask, request, jsonify
+import re
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from flask import Flask, Response, request
 from .saliency import (
-    load_image_from_url,
     load_image_from_path,
     find_salient_point,
 )
+from .cache import focus_from_url, focus_from_image
 import logging
 
+# /focus_batch limits: URLs accepted per request, and images fetched and
+# decoded concurrently (per worker process)
+MAX_BATCH_URLS = 64
+FETCH_THREADS = 16
+
 # Initialize Flask app
 app = Flask(__name__)
 
@@ -37,6 +46,46 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s"
 )
 
+# Accepted image URLs: absolute http(s) URLs without whitespace or markup characters
+_URL_RE = re.compile(r'https?://[^\s<>"]+', re.IGNORECASE)
+
+# Bodies of the static 400 responses, serialized once at import
+_MISSING_PARAM_BODY = orjson.dumps({"error": "Provide either 'url' or 'path' parameter"})
+_INVALID_URL_BODY = orjson.dumps({"error": "The 'url' parameter must be an http(s) URL"})
+_INVALID_BATCH_BODY = orjson.dumps({"error": "Provide a non-empty 'urls' list of http(s) URLs"})
+_BATCH_TOO_LARGE_BODY = orjson.dumps({"error": f"At most {MAX_BATCH_URLS} URLs per request"})
+
+# Downloads and decodes for /focus_batch; threads are only started on demand,
+# so creating the pool before gunicorn forks is safe
+_fetch_pool = ThreadPoolExecutor(max_workers=FETCH_THREADS, thread_name_prefix="fetch")
+
+
+def json_response(payload, status: int = 200) -> Response:
+    """
+    Build a JSON response, serialized with orjson.
+
+    Args:
+        payload: JSON-serializable object.
+        status (int): HTTP status code. Defaults to 200.
+
+    Returns:
+        Response: Flask response with an `application/json` body.
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
+def bad_request(body: bytes) -> Response:
+    """
+    Build a 400 response from a pre-serialized JSON error body.
+
+    Args:
+        body (bytes): JSON-encoded error payload.
+
+    Returns:
+        Response: Flask response with status 400.
+    """
+    return Response(body, status=400, mimetype="application/json")
+
 
 @app.route("/focus", methods=["GET"])
 def focus():
@@ -59,7 +108,7 @@ def focus():
 
     Errors:
     -------
-    - 400: Missing required query parameter
+    - 400: Missing required query parameter, or `url` is not an http(s) URL
     - 500: Internal server error
     """
     url = request.args.get("url")
@@ -67,20 +116,22 @@ def focus():
 
     if not url and not path:
         logging.warning("Missing 'url' or 'path' parameter in request")
-        return jsonify({"error": "Provide either 'url' or 'path' parameter"}), 400
+        return bad_request(_MISSING_PARAM_BODY)
+    if url and not _URL_RE.fullmatch(url):
+        logging.warning(f"Invalid 'url' parameter in request: {url!r}")
+        return bad_request(_INVALID_URL_BODY)
 
     try:
         if url:
             logging.info(f"Received image URL: {url}")
-            img = load_image_from_url(url)
+            (cx, cy), (w, h) = focus_from_url(url, find_salient_point, reduce=None)
         else:
             logging.info(f"Received local path: {path}")
-            img = load_image_from_path(path)
-
-        (cx, cy), (w, h) = find_salient_point(img)
+            img, size = load_image_from_path(path, reduce=None)
+            (cx, cy), (w, h) = focus_from_image(img, size, find_salient_point)
 
         logging.info(f"Salient point computed: ({cx}, {cy}) in image of size ({w}x{h})")
-        return jsonify({
+        return json_response({
             "focus": {"x": cx, "y": cy},
             "width": w,
             "height": h
@@ -88,7 +139,71 @@ def focus():
 
     except Exception as e:
         logging.exception("Error processing request")
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
+
+
+def _focus_entry(url: str) -> dict:
+    """
+    Compute the focus point for one URL of a batch, reporting failures in the entry.
+
+    Args:
+        url (str): URL to the image.
+
+    Returns:
+        dict: Result entry for the /focus_batch response.
+    """
+    try:
+        (cx, cy), (w, h) = focus_from_url(url, find_salient_point, reduce=None)
+        return {"url": url, "focus": {"x": cx, "y": cy}, "width": w, "height": h}
+    except Exception as e:
+        logging.exception(f"Error processing batch URL: {url}")
+        return {"url": url, "error": str(e)}
+
+
+@app.route("/focus_batch", methods=["POST"])
+def focus_batch():
+    """
+    Endpoint to compute the salient points of several images at once.
+
+    Each URL is downloaded, decoded and analyzed on a thread pool, so downloads
+    overlap with saliency work for other URLs.
+
+    Request Body:
+    -------------
+    JSON object: {"urls": [<str>, ...]}
+
+    Returns:
+    --------
+    JSON object, with results in request order:
+    {
+        "results": [
+            {"url": <str>, "focus": {"x": <int>, "y": <int>}, "width": <int>, "height": <int>},
+            {"url": <str>, "error": <str>},
+            ...
+        ]
+    }
+
+    Errors:
+    -------
+    - 400: Missing `urls` list, an entry that is not an http(s) URL, or more than
+      MAX_BATCH_URLS entries
+    """
+    body = request.get_json(silent=True)
+    urls = body.get("urls") if isinstance(body, dict) else None
+
+    if not isinstance(urls, list) or not urls:
+        logging.warning("Missing or invalid 'urls' list in batch request")
+        return bad_request(_INVALID_BATCH_BODY)
+    if len(urls) > MAX_BATCH_URLS:
+        logging.warning(f"Batch request with {len(urls)} URLs exceeds limit of {MAX_BATCH_URLS}")
+        return bad_request(_BATCH_TOO_LARGE_BODY)
+    if not all(isinstance(u, str) and _URL_RE.fullmatch(u) for u in urls):
+        logging.warning("Invalid entry in batch 'urls' list")
+        return bad_request(_INVALID_BATCH_BODY)
+
+    logging.info(f"Received batch of {len(urls)} image URLs")
+    results = list(_fetch_pool.map(_focus_entry, urls))
+    return json_response({"results": results})
 
 
 if __name__ == "__main__":
@@ -14,6 +14,8 @@ Dependencies:
 - NumPy
 - Requests
 - Logging
+- PyTurboJPEG (optional, faster JPEG decoding)
+- Numba (optional, JIT-compiled centroid reduction)
 
 Author: M Ibrahim
 Date: 2025-05-19
@@ -24,8 +26,24 @@ import numpy as np
 import tempfile
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import sys
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+except ImportError:  # optional: fall back to OpenCV's JPEG decoder
+    TurboJPEG = None
+
+try:
+    from numba import njit
+except ImportError:  # optional: fall back to the NumPy centroid reduction
+    njit = None
 
 # Configure logging for debug output
 logging.basicConfig(
@@ -34,63 +52,632 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
+# Connect/read timeouts (seconds) for image downloads
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Shared HTTP session so repeated downloads from the same host reuse
+# keep-alive connections instead of paying a new TCP/TLS handshake each time.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Longest side (pixels) of the downscaled copy used for saliency computation
+SALIENCY_MAX_DIM = 320
+
+
+def _cuda_available() -> bool:
+    """
+    Check whether OpenCV was built with CUDA and a CUDA device is present.
+
+    Returns:
+        bool: True if `cv2.cuda` operations can be used.
+    """
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+# Opt-in (SALIENCY_USE_CUDA=1): run the downscale to the saliency size on the GPU.
+# Off by default, since reduced JPEG decoding already leaves little pixel work
+# and every call pays an upload and a download.
+USE_CUDA = os.environ.get("SALIENCY_USE_CUDA") == "1"
+
+# Whether this process uses CUDA. Probed on first use rather than at import:
+# querying the device initializes CUDA, which does not survive a fork, so doing
+# it in a preloaded gunicorn master would break the GPU path in every worker.
+_cuda_enabled = None
+
+
+def _use_cuda() -> bool:
+    """
+    Return whether this process should downscale on the GPU, probing the device on first call.
+
+    Returns:
+        bool: True if `USE_CUDA` is set and a CUDA device is available.
+    """
+    global _cuda_enabled
+    if _cuda_enabled is None:
+        _cuda_enabled = USE_CUDA and _cuda_available()
+        if _cuda_enabled:
+            logging.info("CUDA device detected, downscaling images on the GPU")
+    return _cuda_enabled
+
+
+# 7-tap Gaussian kernel (sigma derived from size, as GaussianBlur does for sigma=0),
+# applied separably to smooth the saliency map
+_GAUSSIAN_KERNEL_7 = cv2.getGaussianKernel(7, 0, ktype=cv2.CV_32F)
+
+# Near-duplicate shortcut: a new image reuses the focus point of one of the last
+# TEMPORAL_BUFFER_SIZE images if their aspect ratios agree to within
+# TEMPORAL_ASPECT_TOLERANCE and no pixel of their grayscale thumbnails differs by
+# TEMPORAL_MAX_PIXEL_DIFF or more (0-255). A per-pixel bound is needed because a
+# small object moving on a plain background barely changes the mean difference.
+TEMPORAL_THUMB_SIZE = 64
+TEMPORAL_MAX_PIXEL_DIFF = 8
+TEMPORAL_ASPECT_TOLERANCE = 0.01
+TEMPORAL_BUFFER_SIZE = 8
+
+# Recent (thumbnail, aspect ratio, relative focus point) entries
+_recent = deque(maxlen=TEMPORAL_BUFFER_SIZE)
+_recent_lock = threading.Lock()
+
+# OpenCV saliency detectors are not thread-safe, so each thread keeps its own
+# instance and reuses it (and its internal buffers) across requests.
+_detectors = threading.local()
+
+
+def _get_saliency_detector():
+    """
+    Return this thread's cached StaticSaliencyFineGrained detector, creating it on first use.
+
+    Returns:
+        cv2.saliency.StaticSaliencyFineGrained: Reusable saliency detector.
+    """
+    sal = getattr(_detectors, "fine_grained", None)
+    if sal is None:
+        logging.debug("Creating StaticSaliencyFineGrained detector for current thread")
+        sal = cv2.saliency.StaticSaliencyFineGrained_create()
+        _detectors.fine_grained = sal
+    return sal
+
+
+# OpenCV decode flags for reduced-resolution loading. For JPEGs, libjpeg applies
+# the reduction inside its IDCT, so the full-size image is never materialized.
+_REDUCED_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# libjpeg-turbo decoder, if PyTurboJPEG and the native library are installed
+_turbo = None
+if TurboJPEG is not None:
+    try:
+        _turbo = TurboJPEG()
+    except (OSError, RuntimeError) as e:
+        logging.warning(f"TurboJPEG unavailable, using OpenCV for JPEG decoding: {e}")
+
+# JPEG start-of-frame markers (SOF0-SOF15, excluding DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_segments(data):
+    """
+    Iterate over the marker segments of a JPEG header, up to the start of scan.
+
+    Args:
+        data (bytes-like): Encoded image bytes.
+
+    Yields:
+        Tuple[int, int]: (marker, offset) of each segment, where `offset` points at its 0xFF byte.
+    """
+    if data[:2] != b"\xff\xd8":
+        return
+    i, n = 2, len(data)
+    while i + 4 <= n:
+        if data[i] != 0xFF:
+            return
+        marker = data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # standalone markers
+            i += 2
+            continue
+        if marker == 0xDA:  # start of scan: entropy-coded data follows
+            return
+        yield marker, i
+        i += 2 + int.from_bytes(data[i + 2:i + 4], "big")
+
+
+def _jpeg_size(data) -> Optional[Tuple[int, int]]:
+    """
+    Read the pixel dimensions of a JPEG from its start-of-frame header.
+
+    Args:
+        data (bytes-like): Encoded image bytes.
+
+    Returns:
+        Optional[Tuple[int, int]]: (width, height), or None if `data` is not a parsable JPEG.
+    """
+    for marker, i in _jpeg_segments(data):
+        if marker in _JPEG_SOF_MARKERS:
+            if i + 9 > len(data):
+                return None
+            h = int.from_bytes(data[i + 5:i + 7], "big")
+            w = int.from_bytes(data[i + 7:i + 9], "big")
+            return w, h
+    return None
+
 
-def load_image_from_url(url: str) -> np.ndarray:
+def _jpeg_orientation(data) -> int:
+    """
+    Read the EXIF Orientation tag of a JPEG.
+
+    Args:
+        data (bytes-like): Encoded image bytes.
+
+    Returns:
+        int: Orientation value (1-8), or 1 (upright) if the image has no EXIF orientation.
+    """
+    for marker, i in _jpeg_segments(data):
+        if marker != 0xE1 or data[i + 4:i + 10] != b"Exif\x00\x00":
+            continue
+        # TIFF header follows the "Exif\0\0" identifier
+        tiff = i + 10
+        end = i + 2 + int.from_bytes(data[i + 2:i + 4], "big")
+        order = bytes(data[tiff:tiff + 2])
+        if order not in (b"II", b"MM"):
+            return 1
+        byteorder = "little" if order == b"II" else "big"
+        ifd = tiff + int.from_bytes(data[tiff + 4:tiff + 8], byteorder)
+        if ifd + 2 > end:
+            return 1
+        count = int.from_bytes(data[ifd:ifd + 2], byteorder)
+        for entry in range(ifd + 2, min(ifd + 2 + 12 * count, end - 11), 12):
+            if int.from_bytes(data[entry:entry + 2], byteorder) == 0x0112:
+                value = int.from_bytes(data[entry + 8:entry + 10], byteorder)
+                return value if 1 <= value <= 8 else 1
+        return 1
+    return 1
+
+
+def _decode_turbojpeg(arr: np.ndarray, reduce: int) -> Optional[Tuple[np.ndarray, Tuple[int, int]]]:
+    """
+    Decode a JPEG with libjpeg-turbo, scaling and converting to BGR in a single call.
+
+    Images with a non-upright EXIF orientation are left to OpenCV, which applies the
+    orientation tag on decode.
+
+    Args:
+        arr (np.ndarray): Encoded image bytes as a uint8 array.
+        reduce (int): Downscale factor, one of 1, 2, 4 or 8.
+
+    Returns:
+        Optional[Tuple[np.ndarray, Tuple[int, int]]]: Decoded image and full-resolution
+        (width, height), or None if the input should be decoded with OpenCV instead.
+    """
+    data = memoryview(arr)
+    if _turbo is None or data[:3] != b"\xff\xd8\xff" or _jpeg_orientation(data) != 1:
+        return None
+    try:
+        w, h, _, _ = _turbo.decode_header(arr)
+        img = _turbo.decode(
+            arr,
+            pixel_format=TJPF_BGR,
+            scaling_factor=(1, reduce) if reduce > 1 else None,
+        )
+    except (OSError, ValueError) as e:
+        logging.debug(f"TurboJPEG decode failed, falling back to OpenCV: {e}")
+        return None
+    return img, (w, h)
+
+
+def _auto_reduce(size: Tuple[int, int]) -> int:
+    """
+    Pick the largest decode reduction that keeps the longest side at least `SALIENCY_MAX_DIM`.
+
+    Args:
+        size (Tuple[int, int]): (width, height) of the image at full resolution.
+
+    Returns:
+        int: Downscale factor, one of 1, 2, 4 or 8.
+    """
+    long_side = max(size)
+    for factor in (8, 4, 2):
+        # Reduced JPEG decodes round dimensions up
+        if -(-long_side // factor) >= SALIENCY_MAX_DIM:
+            return factor
+    return 1
+
+
+def _decode_image(arr: np.ndarray, reduce: Optional[int]) -> Tuple[Optional[np.ndarray], Tuple[int, int]]:
+    """
+    Decode an encoded image, optionally at a reduced resolution.
+
+    JPEGs are decoded directly at 1/`reduce` scale, using libjpeg-turbo when PyTurboJPEG
+    is available; other formats are decoded in full and then downscaled.
+
+    Args:
+        arr (np.ndarray): Encoded image bytes as a uint8 array.
+        reduce (int, optional): Downscale factor, one of 1, 2, 4 or 8. If None, JPEGs use
+            the largest factor that keeps the longest side at least `SALIENCY_MAX_DIM`,
+            and other formats are decoded at full resolution.
+
+    Returns:
+        Tuple[Optional[np.ndarray], Tuple[int, int]]:
+            - Decoded BGR image, or None if decoding failed.
+            - (width, height) of the image at full resolution.
+    """
+    if reduce is not None and reduce not in _REDUCED_FLAGS:
+        raise ValueError(f"Unsupported reduce factor: {reduce}")
+
+    size = _jpeg_size(memoryview(arr))
+    if reduce is None:
+        reduce = _auto_reduce(size) if size is not None else 1
+
+    decoded = _decode_turbojpeg(arr, reduce)
+    if decoded is not None:
+        return decoded
+
+    if size is not None and reduce > 1:
+        img = cv2.imdecode(arr, _REDUCED_FLAGS[reduce])
+        if img is None:
+            return None, (0, 0)
+        w, h = size
+        # EXIF orientation is applied on decode, so the header size may be transposed
+        ih, iw = img.shape[:2]
+        if abs(iw * w - ih * h) < abs(iw * h - ih * w):
+            w, h = h, w
+        return img, (w, h)
+
+    img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
+    if img is None:
+        return None, (0, 0)
+    h, w = img.shape[:2]
+    if reduce > 1:
+        img = cv2.resize(img, (max(w // reduce, 1), max(h // reduce, 1)), interpolation=cv2.INTER_AREA)
+    return img, (w, h)
+
+
+def download_image(url: str, validators: Optional[Dict[str, str]] = None) -> Tuple[Optional[np.ndarray], Dict[str, str]]:
+    """
+    Download the encoded bytes of an image, optionally as a conditional request.
+
+    Args:
+        url (str): Direct link to an image file.
+        validators (Dict[str, str], optional): `ETag` and/or `Last-Modified` values from a
+            previous response for this URL. When given, the server may reply 304 Not Modified.
+
+    Returns:
+        Tuple[Optional[np.ndarray], Dict[str, str]]:
+            - Encoded image bytes as a uint8 array, or None if `validators` were sent and
+              the server replied 304.
+            - `ETag`/`Last-Modified` validators of the response (may be empty).
+
+    Raises:
+        requests.RequestException: If the image could not be downloaded, including a 304
+            reply to a request that sent no validators.
+    """
+    headers = {}
+    if validators:
+        if "ETag" in validators:
+            headers["If-None-Match"] = validators["ETag"]
+        if "Last-Modified" in validators:
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+    # Stream the body and read it in one go: this avoids the chunk list that
+    # `resp.content` joins, and `np.frombuffer` wraps the bytes without copying.
+    with _session.get(url, timeout=REQUEST_TIMEOUT, stream=True, headers=headers) as resp:
+        resp.raise_for_status()
+        response_validators = {k: resp.headers[k] for k in ("ETag", "Last-Modified") if k in resp.headers}
+        if resp.status_code == 304:
+            if not headers:
+                raise requests.HTTPError(f"Unexpected 304 Not Modified for unconditional request: {url}", response=resp)
+            logging.debug(f"Image not modified: {url}")
+            return None, response_validators or dict(validators or {})
+        data = resp.raw.read(decode_content=True)
+    return np.frombuffer(data, np.uint8), response_validators
+
+
+def decode_image(arr: np.ndarray, reduce: Optional[int] = 1, source: str = "image data") -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Decode encoded image bytes into OpenCV (BGR) format.
+
+    Args:
+        arr (np.ndarray): Encoded image bytes as a uint8 array.
+        reduce (int, optional): Decode at 1/`reduce` resolution (1, 2, 4 or 8), or None to
+            pick the largest factor that keeps the longest side at least `SALIENCY_MAX_DIM`.
+            Defaults to 1.
+        source (str): Description of where the bytes came from, used in error messages.
+
+    Returns:
+        Tuple[np.ndarray, Tuple[int, int]]:
+            - Image in BGR format.
+            - (width, height) of the image at full resolution.
+
+    Raises:
+        ValueError: If the image could not be decoded.
+    """
+    img, size = _decode_image(arr, reduce)
+    if img is None:
+        raise ValueError(f"Could not decode image from {source}")
+    logging.debug(f"Image loaded with shape: {img.shape} (full size: {size})")
+    return img, size
+
+
+def load_image_from_url(url: str, reduce: Optional[int] = 1) -> Tuple[np.ndarray, Tuple[int, int]]:
     """
     Download and decode an image from a URL into OpenCV (BGR) format.
 
     Args:
         url (str): Direct link to an image file.
+        reduce (int, optional): Decode at 1/`reduce` resolution (1, 2, 4 or 8), or None to
+            pick the largest factor that keeps the longest side at least `SALIENCY_MAX_DIM`.
+            Defaults to 1.
 
     Returns:
-        np.ndarray: Image loaded in BGR format.
+        Tuple[np.ndarray, Tuple[int, int]]:
+            - Image loaded in BGR format.
+            - (width, height) of the image at full resolution.
 
     Raises:
         requests.RequestException: If the image could not be downloaded.
         ValueError: If the image could not be decoded.
     """
     logging.info(f"Loading image from URL: {url}")
-    resp = requests.get(url, timeout=10)
-    resp.raise_for_status()
-    arr = np.frombuffer(resp.content, np.uint8)
-    img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-    if img is None:
-        raise ValueError(f"Could not decode image from URL: {url}")
-    logging.debug(f"Image loaded with shape: {img.shape}")
-    return img
+    arr, _ = download_image(url)
+    return decode_image(arr, reduce, source=f"URL: {url}")
 
 
-def load_image_from_path(path: str) -> np.ndarray:
+def load_image_from_path(path: str, reduce: Optional[int] = 1) -> Tuple[np.ndarray, Tuple[int, int]]:
     """
     Load an image from a local file path into OpenCV (BGR) format.
 
     Args:
         path (str): Local filesystem path to the image.
+        reduce (int, optional): Decode at 1/`reduce` resolution (1, 2, 4 or 8), or None to
+            pick the largest factor that keeps the longest side at least `SALIENCY_MAX_DIM`.
+            Defaults to 1.
 
     Returns:
-        np.ndarray: Image loaded in BGR format.
+        Tuple[np.ndarray, Tuple[int, int]]:
+            - Image loaded in BGR format.
+            - (width, height) of the image at full resolution.
 
     Raises:
         FileNotFoundError: If the image cannot be loaded.
     """
     logging.info(f"Loading image from path: {path}")
-    img = cv2.imread(path)
+    try:
+        arr = np.fromfile(path, np.uint8)
+    except OSError:
+        arr = None
+    img, size = _decode_image(arr, reduce) if arr is not None and arr.size else (None, (0, 0))
     if img is None:
         raise FileNotFoundError(f"Could not load image at path: {path}")
-    logging.debug(f"Image loaded with shape: {img.shape}")
-    return img
+    logging.debug(f"Image loaded with shape: {img.shape} (full size: {size})")
+    return img, size
 
 
-def find_salient_point(img: np.ndarray):
+def _downscale(img: np.ndarray, dsize: Tuple[int, int]) -> np.ndarray:
+    """
+    Downscale an image with area interpolation, on the GPU if `USE_CUDA` is set and a
+    device is available.
+
+    Args:
+        img (np.ndarray): Input image in BGR format.
+        dsize (Tuple[int, int]): Target (width, height).
+
+    Returns:
+        np.ndarray: Downscaled image.
+    """
+    if _use_cuda():
+        gpu_img = cv2.cuda_GpuMat()
+        gpu_img.upload(img)
+        return cv2.cuda.resize(gpu_img, dsize, interpolation=cv2.INTER_AREA).download()
+    return cv2.resize(img, dsize, interpolation=cv2.INTER_AREA)
+
+
+if njit is not None:
+    # Numba logs its compiler passes at DEBUG, which the root logger above would emit
+    logging.getLogger("numba").setLevel(logging.WARNING)
+
+    # Single-threaded on purpose: gunicorn already runs a worker per core with
+    # several request threads each, so a parallel kernel would only add dispatch cost
+    @njit(fastmath=True, cache=True)
+    def _centroid_sums(weights):
+        """Return (sum_w, sum_wx, sum_wy) of a 2D weight map in a single pass."""
+        h, w = weights.shape
+        sum_w = 0.0
+        sum_wx = 0.0
+        sum_wy = 0.0
+        for y in range(h):
+            row_w = 0.0
+            row_wx = 0.0
+            for x in range(w):
+                v = weights[y, x]
+                row_w += v
+                row_wx += v * x
+            sum_w += row_w
+            sum_wx += row_wx
+            sum_wy += row_w * y
+        return sum_w, sum_wx, sum_wy
+
+else:
+    _centroid_sums = None
+
+# Kernel used by _weighted_centroid once warmed up: None until then, False if unusable
+_centroid_kernel = None
+_centroid_kernel_lock = threading.Lock()
+
+
+def _get_centroid_kernel():
+    """
+    Return the Numba centroid kernel, compiling it (or loading it from the on-disk cache) on first use.
+
+    This is deliberately not done at import, so a gunicorn master does not pay the
+    compile time; each worker prepares it in `warm_up` instead.
+
+    Returns:
+        Optional[Callable]: `_centroid_sums`, or None if Numba is unavailable or the
+        kernel could not be compiled.
+    """
+    global _centroid_kernel
+    if _centroid_kernel is None:
+        with _centroid_kernel_lock:
+            if _centroid_kernel is None:
+                kernel = False
+                if _centroid_sums is not None:
+                    try:
+                        _centroid_sums(np.zeros((2, 2), dtype=np.float32))
+                        kernel = _centroid_sums
+                        logging.debug("Numba centroid kernel ready")
+                    except Exception as e:
+                        logging.warning(f"Numba kernel unavailable, using NumPy centroid reduction: {e}")
+                _centroid_kernel = kernel
+    return _centroid_kernel or None
+
+
+def warm_up():
+    """
+    Prepare per-process state ahead of the first request.
+
+    Call once in each worker process after it has been forked (e.g. from a gunicorn
+    `post_fork` hook); without it, the first request does this work instead.
+    """
+    _get_centroid_kernel()
+    _use_cuda()
+
+
+@lru_cache(maxsize=64)
+def _index_ramp(n: int) -> np.ndarray:
+    """Return a cached read-only float32 array [0, 1, ..., n - 1] for centroid sums."""
+    ramp = np.arange(n, dtype=np.float32)
+    ramp.setflags(write=False)
+    return ramp
+
+
+def _weighted_centroid(weights: np.ndarray) -> Optional[Tuple[float, float]]:
+    """
+    Compute the centroid of a 2D weight map.
+
+    Args:
+        weights (np.ndarray): Non-negative float32 weights, shape (H, W).
+
+    Returns:
+        Optional[Tuple[float, float]]: (x, y) centroid in pixel coordinates, or None if
+        all weights are zero.
+    """
+    kernel = _get_centroid_kernel()
+    if kernel is not None:
+        total, sum_wx, sum_wy = kernel(weights)
+        if total <= 0:
+            return None
+        return sum_wx / total, sum_wy / total
+
+    total = float(weights.sum())
+    if total <= 0:
+        return None
+    h, w = weights.shape
+    cx = float(weights.sum(axis=0) @ _index_ramp(w)) / total
+    cy = float(weights.sum(axis=1) @ _index_ramp(h)) / total
+    return cx, cy
+
+
+def thumbnail(img: np.ndarray) -> np.ndarray:
+    """
+    Compute the grayscale thumbnail used to recognize near-identical images.
+
+    Args:
+        img (np.ndarray): Image in BGR format.
+
+    Returns:
+        np.ndarray: `TEMPORAL_THUMB_SIZE` x `TEMPORAL_THUMB_SIZE` uint8 grayscale thumbnail.
+    """
+    return cv2.resize(
+        cv2.cvtColor(img, cv2.COLOR_BGR2GRAY),
+        (TEMPORAL_THUMB_SIZE, TEMPORAL_THUMB_SIZE),
+        interpolation=cv2.INTER_AREA,
+    )
+
+
+def thumbnails_match(thumb: np.ndarray, aspect: float, other_thumb: np.ndarray, other_aspect: float) -> bool:
+    """
+    Return whether two images are near-identical, judged by their thumbnails and aspect ratios.
+
+    Args:
+        thumb (np.ndarray): Thumbnail of the first image (see `thumbnail`).
+        aspect (float): Width / height of the first image.
+        other_thumb (np.ndarray): Thumbnail of the second image.
+        other_aspect (float): Width / height of the second image.
+
+    Returns:
+        bool: True if the aspect ratios agree to within `TEMPORAL_ASPECT_TOLERANCE` and no
+        thumbnail pixel differs by `TEMPORAL_MAX_PIXEL_DIFF` or more.
+    """
+    if abs(aspect - other_aspect) > TEMPORAL_ASPECT_TOLERANCE * other_aspect:
+        return False
+    return int(cv2.absdiff(thumb, other_thumb).max()) < TEMPORAL_MAX_PIXEL_DIFF
+
+
+def _find_recent(thumb: np.ndarray, aspect: float) -> Optional[Tuple[float, float]]:
+    """
+    Look up a recently processed image whose thumbnail nearly matches `thumb`.
+
+    Args:
+        thumb (np.ndarray): Thumbnail of the current image (see `thumbnail`).
+        aspect (float): Width / height of the current image.
+
+    Returns:
+        Optional[Tuple[float, float]]: Focus point of the matching image relative to its
+        size, or None if no recent image is close enough.
+    """
+    with _recent_lock:
+        recent = list(_recent)
+    for prev_thumb, prev_aspect, rel in reversed(recent):
+        if thumbnails_match(thumb, aspect, prev_thumb, prev_aspect):
+            return rel
+    return None
+
+
+def _remember_recent(thumb: np.ndarray, point: Tuple[int, int], size: Tuple[int, int]):
+    """
+    Record an image's thumbnail and focus point for the near-duplicate shortcut.
+
+    Args:
+        thumb (np.ndarray): Thumbnail of the image (see `thumbnail`).
+        point (Tuple[int, int]): Focus point in original image coordinates.
+        size (Tuple[int, int]): (width, height) of the original image.
+    """
+    rel = ((point[0] + 0.5) / size[0], (point[1] + 0.5) / size[1])
+    with _recent_lock:
+        _recent.append((thumb, size[0] / size[1], rel))
+
+
+def find_salient_point(img: np.ndarray, size: Optional[Tuple[int, int]] = None):
     """
     Find the most salient point (centroid of high-attention area) in an image.
 
     Uses OpenCV's StaticSaliencyFineGrained algorithm to calculate the saliency map,
-    smooths the result, thresholds it using Otsu's method, and then finds the centroid
-    of the most significant contour.
+    smooths the result, and then takes the centroid of the map weighted by each pixel's
+    squared saliency above the mean.
+
+    Saliency is computed on a copy downscaled so its longest side is at most
+    `SALIENCY_MAX_DIM` pixels, and the result is scaled back to the original size.
+    `img` may itself be a reduced-resolution decode (e.g. loaded with `reduce=2`),
+    in which case `size` gives the original dimensions.
 
     Args:
         img (np.ndarray): Input image in BGR format.
+        size (Tuple[int, int], optional): (width, height) of the original image.
+            Defaults to the size of `img`.
 
     Returns:
         Tuple[Tuple[int, int], Tuple[int, int]]:
@@ -102,11 +689,27 @@ def find_salient_point(img: np.ndarray):
     """
     logging.info("Starting salient point detection")
     logging.debug(f"Input image shape = {img.shape}")
-    h, w = img.shape[:2]
+    ih, iw = img.shape[:2]
+    w, h = size if size is not None else (iw, ih)
+
+    # Step 1: Downscale to the canonical saliency size; focus-point quality
+    # saturates well below full resolution
+    scale = min(1.0, SALIENCY_MAX_DIM / max(w, h))
+    sw, sh = max(int(round(w * scale)), 1), max(int(round(h * scale)), 1)
+    if (iw, ih) == (sw, sh):
+        small = img
+    else:
+        small = _downscale(img, (sw, sh))
+
+    # Reuse the focus point of a recent near-identical image, if any
+    thumb = thumbnail(small)
+    rel = _find_recent(thumb, w / h)
+    if rel is not None:
+        cx, cy = int(rel[0] * w), int(rel[1] * h)
+        logging.info(f"Reusing focus point of a near-identical recent image: ({cx}, {cy})")
+        return (cx, cy), (w, h)
 
-    # Step 1: Downscale image for faster saliency computation
-    small = cv2.resize(img, (w // 2, h // 2))
-    sal = cv2.saliency.StaticSaliencyFineGrained_create()
+    sal = _get_saliency_detector()
     try:
         ok, salmap = sal.computeSaliency(small)
     except ValueError:
@@ -114,42 +717,31 @@ def find_salient_point(img: np.ndarray):
         ok = True
     if not ok:
         raise RuntimeError("Saliency computation failed")
-    salmap = (salmap * 255).astype("uint8")
     logging.debug("Saliency map successfully computed")
 
-    # Step 2: Apply Gaussian blur to reduce noise
-    salmap = cv2.GaussianBlur(salmap, (7, 7), 0)
+    # Step 2: Apply Gaussian blur to reduce noise (the map stays float32 in [0, 1])
+    salmap = cv2.sepFilter2D(salmap, -1, _GAUSSIAN_KERNEL_7, _GAUSSIAN_KERNEL_7)
 
-    # Step 3: Resize saliency map to original image size and normalize
-    salmap = cv2.resize(salmap, (w, h), interpolation=cv2.INTER_LINEAR)
-    salmap = cv2.normalize(salmap, None, 0, 255, cv2.NORM_MINMAX)
+    # Step 3: Weight pixels by their squared positive deviation from the mean,
+    # which suppresses background noise without thresholding or morphology
+    weights = np.subtract(salmap, salmap.mean(), dtype=np.float32)
+    np.clip(weights, 0, None, out=weights)
+    weights **= 2
 
-    # Step 4: Binarize using Otsu’s thresholding and remove noise
-    _, th = cv2.threshold(salmap, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
-    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-    th = cv2.morphologyEx(th, cv2.MORPH_OPEN, kernel, iterations=2)
+    # Step 4: Weighted centroid of the saliency map
+    centroid = _weighted_centroid(weights)
+    if centroid is not None:
+        cx = int((centroid[0] + 0.5) * w / sw)
+        cy = int((centroid[1] + 0.5) * h / sh)
+        logging.info(f"Salient point located at centroid: ({cx}, {cy})")
+        _remember_recent(thumb, (cx, cy), (w, h))
+        return (cx, cy), (w, h)
 
-    # Step 5: Find external contours
-    cnts_ret = cv2.findContours(th, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    if len(cnts_ret) == 3:
-        _, cnts, _ = cnts_ret
-    else:
-        cnts, _ = cnts_ret
-    logging.debug(f"Found {len(cnts)} external contours")
-
-    # Step 6: Determine centroid of largest contour
-    if cnts:
-        c = max(cnts, key=cv2.contourArea)
-        M = cv2.moments(c)
-        if M["m00"] != 0:
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
-            logging.info(f"Salient point located at centroid: ({cx}, {cy})")
-            return (cx, cy), (w, h)
-
-    # Step 7: Fallback to most intense point in saliency map
-    _, max_val, _, max_loc = cv2.minMaxLoc(salmap)
+    # Step 5: Fallback to most intense point in saliency map
+    _, max_val, _, (mx, my) = cv2.minMaxLoc(salmap)
+    max_loc = (int((mx + 0.5) * w / sw), int((my + 0.5) * h / sh))
     logging.warning(
-        f"No valid contour found. Falling back to max saliency location: {max_loc} (val={max_val})"
+        f"No salient region found. Falling back to max saliency location: {max_loc} (val={max_val})"
     )
+    _remember_recent(thumb, max_loc, (w, h))
     return max_loc, (w, h)
@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration for the saliency API.
+
+Workers are forked after the app is imported (`preload_app`), so Python modules,
+OpenCV and the static setup in `app` are loaded once in the master and shared
+copy-on-write. State that does not survive a fork (CUDA) is never created in
+the master; `post_fork` initializes it, and compiles the Numba kernel, in each
+worker. Parallelism comes from the processes and their threads: threaded workers
+compute saliency for concurrent requests in parallel, since OpenCV releases the GIL.
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Set up per-process state (Numba kernel, CUDA) in each freshly forked worker."""
+    from app.saliency import warm_up
+
+    warm_up()